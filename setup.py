@@ -23,6 +23,9 @@ setup(
         'datasets': [
             'scikit-learn'
         ],
+        'separability': [
+            'scipy'
+        ],
         'tests': [
             'scipy',
             'scikit-learn'
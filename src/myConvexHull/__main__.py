@@ -1,6 +1,6 @@
 import argparse
-import pandas as pd
 
+from myConvexHull.cache import read_csv_cached
 from myConvexHull.lib import LinearSeparabilityDataset
 
 # Argument Parser
@@ -34,6 +34,7 @@ ginput = parser.add_argument_group('File Dataset Input')
 ginput.add_argument('-f', '--file', help='Input datasets file. Should have minimum 3 columns: 2 features and a target.')
 ginput.add_argument('-tk', '--target_key', help='Target column name.', default='target')
 ginput.add_argument('-tn', '--target_names', nargs='+', help='Target name list, separated by space.')
+ginput.add_argument('-ncc', '--no_cache', help='Disable the binary cache of the parsed input file.', action='store_true')
 # Group Sklearn Dataset
 tinput = parser.add_argument_group('Sklearn Dataset Input')
 tinput.add_argument('-n', '--dataset_name', help='Name of the dataset.')
@@ -68,9 +69,8 @@ if args.dataset_name:
         target_names=data.target_names,
     )
 else:
-    # Load the dataset from file
-    data = pd.read_csv(args.file)
-    data.dropna(inplace=True)
+    # Load the dataset from file (or its cached binary copy)
+    data = read_csv_cached(args.file, cache=(not args.no_cache))
     vis = LinearSeparabilityDataset(
         frame=data,
         target_key=args.target_key,
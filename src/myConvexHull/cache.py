@@ -0,0 +1,207 @@
+"""
+Binary columnar cache for dataset files.
+Avoid parsing the same csv file again on every run.
+"""
+
+import hashlib
+import json
+import os
+import uuid
+import numpy as np
+import pandas as pd
+
+from typing import Dict, Optional
+
+CACHE_VERSION = 3
+"""Version of the cache layout. Bump it if the layout changes,
+so the old cache will be rebuilt.
+"""
+
+def cache_dir(path: str) -> str:
+    """Get the cache directory of a dataset file.
+
+    The cache is stored next to the file, in a hidden directory
+    named after the file (e.g. `data.csv` -> `.data.csv.cache`).
+
+    Args:
+        path (str): Dataset file path.
+
+    Returns:
+        str: Cache directory path.
+    """
+    head, tail = os.path.split(os.path.abspath(path))
+    return os.path.join(head, f'.{tail}.cache')
+
+def file_hash(path: str) -> str:
+    """Calculate the sha256 hash of a file content.
+
+    Args:
+        path (str): File path.
+
+    Returns:
+        str: Hex digest of the file content.
+    """
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def _read_meta(cdir: str) -> Optional[Dict]:
+    """Read the cache metadata, None if not exists or broken.
+    """
+    try:
+        with open(os.path.join(cdir, 'meta.json')) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return meta if meta.get('version') == CACHE_VERSION else None
+
+def _write_meta(cdir: str, meta: Dict) -> None:
+    """Write the cache metadata atomically.
+    """
+    tmp = os.path.join(cdir, f'meta.json.{uuid.uuid4().hex}.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(meta, f)
+    os.replace(tmp, os.path.join(cdir, 'meta.json'))
+
+def _column_path(cdir: str, generation: str, i: int) -> str:
+    """Get the file path of a cached column.
+    """
+    return os.path.join(cdir, f'{generation}-{i}.npy')
+
+def _load(cdir: str, meta: Dict) -> pd.DataFrame:
+    """Load the cached frame, every column is memory-mapped.
+
+    The columns are mapped copy-on-write, so the frame is writable
+    and any change is never written back to the cache.
+    """
+    frame = {}
+    for i, (col, text, dtype) in enumerate(meta['columns']):
+        # np.asarray gives a plain ndarray view of the memmap, no copy.
+        values = np.asarray(np.load(
+            _column_path(cdir, meta['generation'], i),
+            mmap_mode='c',
+            allow_pickle=False,
+        ))
+        if len(values) != meta['rows']:
+            raise ValueError(f'Cached column {col!r} has a wrong length.')
+        # Text column is stored as fixed width unicode, convert it
+        # back to its original dtype.
+        frame[col] = pd.Series(values).astype(dtype) if text else values
+    return pd.DataFrame(frame, copy=False)
+
+def _store(
+    cdir: str,
+    frame: pd.DataFrame,
+    key: Dict,
+    old: Optional[Dict]=None,
+) -> None:
+    """Store each column of the frame as its own .npy file.
+
+    Text column is stored as fixed width unicode instead of python
+    objects, so the cache never needs to be unpickled.
+
+    Every store writes a new generation of files, then switches
+    `meta.json` to it in one atomic step. A file that may still be
+    memory-mapped by a returned frame is never overwritten, the old
+    generation is only unlinked (the mapping stays valid).
+    """
+    os.makedirs(cdir, exist_ok=True)
+    generation = uuid.uuid4().hex
+    columns = []
+    for i, col in enumerate(frame.columns):
+        values = np.asarray(frame[col].values)
+        # Non numeric column (e.g. string or pandas extension
+        # dtype) is converted to numpy unicode array.
+        text = values.dtype.hasobject
+        if text:
+            values = values.astype(str)
+        np.save(
+            _column_path(cdir, generation, i),
+            values,
+            allow_pickle=False,
+        )
+        columns.append((col, text, str(frame[col].dtype)))
+    _write_meta(cdir, {
+        'version': CACHE_VERSION,
+        **key,
+        'generation': generation,
+        'rows': len(frame),
+        'columns': columns,
+    })
+    # Clean up the previous generation, best effort (e.g. a mapped
+    # file can't be removed on Windows).
+    if old is not None:
+        for i in range(len(old['columns'])):
+            try:
+                os.remove(_column_path(cdir, old['generation'], i))
+            except OSError:
+                pass
+
+def _try_load(cdir: str, meta: Dict) -> Optional[pd.DataFrame]:
+    """Load the cached frame, None if the cache is broken.
+    """
+    try:
+        return _load(cdir, meta)
+    except Exception:
+        return None
+
+def read_csv_cached(path: str, cache: bool=True) -> pd.DataFrame:
+    """Read a csv dataset file, with its row containing NaN dropped.
+
+    On the first read, the parsed frame is stored as a binary columnar
+    copy next to the file (see `cache_dir`). Later reads will
+    memory-map that copy instead of parsing the csv again, as long as
+    the file has not changed. The file is considered unchanged if its
+    mtime and size are the same as the cached one, or otherwise if its
+    size and content hash are still the same. The hash is stored on
+    every cache write, and only computed again when the size is the
+    same but the mtime is not. The index of the frame is not kept.
+    The returned frame is always writable, changing it or rebuilding
+    the cache later does not change it.
+
+    If the cache is broken, it is rebuilt. If the cache can't be
+    written (e.g. read-only directory), the frame is still returned
+    without caching.
+
+    Args:
+        path (str): Csv file path.
+        cache (bool, optional): Use the cache. Defaults to True.
+
+    Returns:
+        pd.DataFrame: Dataframe of the dataset.
+    """
+    if not cache:
+        return pd.read_csv(path).dropna().reset_index(drop=True)
+    cdir = cache_dir(path)
+    stat = os.stat(path)
+    key = {'mtime': stat.st_mtime_ns, 'size': stat.st_size}
+    meta = _read_meta(cdir)
+    # Different size means the file is changed, no need to hash it.
+    if meta is not None and meta['size'] == key['size']:
+        # Fast path, the file is not touched since cached.
+        if meta['mtime'] == key['mtime']:
+            frame = _try_load(cdir, meta)
+            if frame is not None:
+                return frame
+        # The file is touched, but the content may still be the same.
+        key['hash'] = file_hash(path)
+        if meta.get('hash') == key['hash']:
+            frame = _try_load(cdir, meta)
+            if frame is not None:
+                meta.update(key)
+                try:
+                    _write_meta(cdir, meta)
+                except OSError:
+                    pass
+                return frame
+    # Cache miss, parse the csv and store it with its hash.
+    if 'hash' not in key:
+        key['hash'] = file_hash(path)
+    frame = pd.read_csv(path).dropna().reset_index(drop=True)
+    try:
+        _store(cdir, frame, key, meta)
+    except Exception:
+        pass
+    return frame
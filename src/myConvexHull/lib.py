@@ -5,14 +5,21 @@ Main class definitions
 import numpy as np
 import pandas as pd
 
+from concurrent.futures import ThreadPoolExecutor
 from itertools import cycle
 from matplotlib import pyplot as plt
-from typing import Dict, Iterable, List, Tuple
-from myConvexHull.types import Feature, Line, Point, PointIndex, LineIndex
+from typing import Dict, Iterable, List, Optional, Tuple
+from myConvexHull.types import (
+    Feature, Hyperplane, Line, Point, PointIndex, LineIndex, Target
+)
 from myConvexHull.utils import det, dist_to_line
 
 class ConvexHull(object):
-    def __init__(self, dt: Iterable):
+    accept_order = True
+    """The constructor accepts presorted `order` of the points.
+    """
+
+    def __init__(self, dt: Iterable, order: Iterable[PointIndex]=None):
         """Create new convex hull instance.
 
         It will auto process the data by generating
@@ -21,7 +28,15 @@ class ConvexHull(object):
         Args:
             dt (Iterable): List of 2D points, where each element
                 is an iterable that has two number, (x, y).
+            order (Iterable[int], optional): Index of the points sorted
+                ascending by their x and then y coordinate (ties are
+                kept in index order). If given, the points will not be
+                sorted again. Defaults to None.
         """
+        # Convert numpy array to python number once, arithmetic on
+        # numpy scalar is a lot slower in the pure python loop.
+        if isinstance(dt, np.ndarray):
+            dt = dt[:, :2].tolist()
         dt: List[Point] = [(p[0], p[1]) for p in dt]
         self.points = dt
         """All points inside and in the convex hull.
@@ -34,7 +49,7 @@ class ConvexHull(object):
         """List of the line/edge in the convex hull. Each element
         is a tuple, that is a pair of two index from self.points.
         """
-        self.__convexHull()
+        self.__convexHull(order)
     
     def __dnc_convexHull(self, dt: List[PointIndex], line: LineIndex):
         """Divide and Conquer algo of convex hull.
@@ -110,8 +125,12 @@ class ConvexHull(object):
             # 4.2 Check for points outside the second line.
             self.__dnc_convexHull(dt_split[1], newline[1])
     
-    def __convexHull(self):
+    def __convexHull(self, order: Iterable[PointIndex]=None):
         """The first step before recursive DnC algo.
+
+        Args:
+            order (Iterable[int], optional): Presorted index of
+                the points. Defaults to None.
         """
         # Get index list of all points
         dt = [i for i in range(len(self.points))]
@@ -126,8 +145,12 @@ class ConvexHull(object):
         # If there are more than 2 points,
         # then we need to check for some things
         elif len(dt) > 2:
-            # Sort the points ascending by their x and y coordinate
-            dt.sort(key=lambda x: self.points[x])
+            # Sort the points ascending by their x and y coordinate,
+            # unless it is already sorted by the caller.
+            if order is None:
+                dt.sort(key=lambda x: self.points[x])
+            else:
+                dt = np.asarray(order).tolist()
             # Get the line that start from minimum point
             # to maximum point based on their x coordinate.
             line = (dt[0], dt[-1])
@@ -182,7 +205,8 @@ class LinearSeparabilityDataset(object):
         target_names: Iterable,
         feature_names: Iterable=None,
         target_key: str='target',
-        backend: ConvexHull=ConvexHull
+        backend: ConvexHull=ConvexHull,
+        workers: Optional[int]=1,
     ) -> None:
         """Create new instance of Linearly Separable Data.
         Useful to easy visualize the data given their dataset.
@@ -217,10 +241,18 @@ class LinearSeparabilityDataset(object):
                 Defaults to 'target'.
             backend (ConvexHull, optional): Convex hull computation
                 backend. Defaults to custom ConvexHull.
+            workers (int, optional): Number of threads to compute the
+                convex hull of each target concurrently. Only backend
+                that releases the GIL (e.g. scipy's ConvexHull) will
+                run in parallel, not the custom pure python ConvexHull.
+                The thread pool is created once and reused for every
+                pair of features. None to use the default thread pool
+                size. Defaults to 1 (no thread pool).
         
         Raises:
             ValueError: If the length of `target_names` or
-            `feature_names` is not qualified.
+            `feature_names` is not qualified, or `workers` is
+            less than 1.
             KeyError: If `target_key` not exists in the frame.
         """
         if len(target_names) != frame[target_key].nunique():
@@ -251,11 +283,38 @@ class LinearSeparabilityDataset(object):
                 "The `target_key` should be in the frame."
             )
 
+        if workers is not None and workers < 1:
+            raise ValueError(
+                "The `workers` should be at least 1 "
+                "(Got {}).".format(workers)
+            )
+
         self.__convex: Dict[str, List[ConvexHull]] = {}
         """List of convex hull for each target and for each
         pair of features. The key is joined index of both
         feature in the pair, separated by ';'.
         """
+        self.__order: Dict[int, List[np.ndarray]] = {}
+        """Stable argsort of each feature column for each target.
+        The key is the feature index, shared by every pair of
+        features that use it as the first feature.
+        """
+        self.__column: Dict[int, List[np.ndarray]] = {}
+        """Values of each feature column for each target. The key is
+        the feature index, so the points of a pair of features are
+        only a stack of two cached columns.
+        """
+        self.__hyperplane: Dict[Tuple[int, int], Optional[Hyperplane]] = {}
+        """Separating hyperplane in the full feature space for each
+        pair of target. The key is a pair of target index, where the
+        first target is on the positive side of the hyperplane. The
+        value is None if both target are not linearly separable.
+        """
+        self.__nd_points: Optional[List[np.ndarray]] = None
+        """Feature matrix of each target, augmented with a constant 1
+        column for the bias term. Built once on the first
+        `separable_nd` call and shared by every pair of target.
+        """
         self.target_key = target_key
         """Target column name in the dataframe.
         """
@@ -272,6 +331,13 @@ class LinearSeparabilityDataset(object):
         self.backend = backend
         """Backend of the convex hull library.
         """
+        self.workers = workers
+        """Number of threads to compute the convex hull.
+        """
+        self.__pool: Optional[ThreadPoolExecutor] = None
+        """Thread pool to compute the convex hull, lazily created
+        on the first use and shared by every pair of features.
+        """
 
     def __getPair(self, pair1: Feature, pair2: Feature) -> Tuple[int, int]:
         """Get the feature pair index.
@@ -292,6 +358,78 @@ class LinearSeparabilityDataset(object):
             if isinstance(pair2, str) else pair2,
         ))
 
+    def __getTarget(self, target: Target) -> int:
+        """Get the target index given its name or index.
+
+        Args:
+            target (Target): Target name or index.
+
+        Returns:
+            int: Target index.
+
+        Raises:
+            ValueError: If the target name is not in `target_names`.
+            IndexError: If the target index is out of range.
+        """
+        if isinstance(target, str):
+            return list(self.target_names).index(target)
+        if not 0 <= target < len(self.target_names):
+            raise IndexError(
+                "The target index should be in range [0, {}) "
+                "(Got {}).".format(len(self.target_names), target)
+            )
+        return target
+
+    def __getColumn(self, p: int) -> List[np.ndarray]:
+        """Get the values of a feature column for each target.
+        It is computed only once for each feature.
+
+        Args:
+            p (int): Feature index.
+
+        Returns:
+            List[np.ndarray]: Values of the feature for each target.
+        """
+        if p not in self.__column:
+            target = self.frame[self.target_key].values
+            column = self.frame.iloc[:, p].values
+            self.__column[p] = [
+                column[target == i]
+                for i in range(len(self.target_names))
+            ]
+        return self.__column[p]
+
+    def __getOrder(self, order: np.ndarray, bucket: np.ndarray) -> np.ndarray:
+        """Get the index of the points sorted by x and then y.
+
+        The sort by x (first feature) is computed only once for
+        each feature and target, then reused for every pair that
+        use it as the first feature. Only the points with the same
+        x are sorted again by their y.
+
+        Args:
+            order (np.ndarray): Stable argsort of the points by x.
+            bucket (np.ndarray): Points of the target, where the
+                first column is x and the second column is y.
+
+        Returns:
+            np.ndarray: Sorted index of the points in the bucket.
+        """
+        x, y = bucket[order, 0], bucket[order, 1]
+        # Mark the points that have the same x as its neighbour.
+        same = x[1:] == x[:-1]
+        if not same.any():
+            return order
+        tie = np.zeros(len(x), dtype=bool)
+        tie[1:] |= same
+        tie[:-1] |= same
+        # Group id of each run with the same x, then sort the tied
+        # points by their y inside each group (lexsort is stable).
+        group = np.cumsum(np.concatenate([[True], ~same]))[tie]
+        order = order.copy()
+        order[tie] = order[tie][np.lexsort((y[tie], group))]
+        return order
+
     def __calculate(self, key:str, p1: int, p2: int) -> None:
         """Calculate the convex hull for each target.
 
@@ -300,15 +438,34 @@ class LinearSeparabilityDataset(object):
             p1 (int): First feature index.
             p2 (int): Second feature index.
         """
-        self.__convex[key] = []
+        col1, col2 = self.__getColumn(p1), self.__getColumn(p2)
+        # Sort each target by the first feature once, if the backend
+        # can make use of it.
+        presort = getattr(self.backend, 'accept_order', False)
+        if presort and p1 not in self.__order:
+            self.__order[p1] = [
+                np.argsort(column, kind='stable') for column in col1
+            ]
+        args = []
         for i in range(len(self.target_names)):
-            # Get the dataframe with same target name.
-            bucket = self.frame[self.frame[self.target_key] == i]
-            # Get the pair of values from both features.
-            # It will be our points.
-            bucket = bucket.iloc[:, [p1, p2]].values
-            # Create the convex hull and append it to the list.
-            self.__convex[key].append(self.backend(bucket))
+            # Get the pair of values from both features of the
+            # target. It will be our points.
+            bucket = np.column_stack((col1[i], col2[i]))
+            if presort:
+                order = self.__getOrder(self.__order[p1][i], bucket)
+                args.append((bucket, order))
+            else:
+                args.append((bucket,))
+        # Create the convex hull for each target, keeping the order
+        # of the target. Any error will be raised here.
+        if self.workers == 1 or len(args) < 2:
+            self.__convex[key] = [self.backend(*arg) for arg in args]
+        else:
+            if self.__pool is None:
+                self.__pool = ThreadPoolExecutor(max_workers=self.workers)
+            self.__convex[key] = list(
+                self.__pool.map(lambda arg: self.backend(*arg), args)
+            )
 
     def getConvex(self, pair1: Feature, pair2: Feature) -> List[ConvexHull]:
         """Get convex hull given pair of features.
@@ -333,6 +490,124 @@ class LinearSeparabilityDataset(object):
         self.__calculate(key, pair1, pair2)
         return self.__convex[key]
 
+    def __calculate_nd(self, a: int, b: int) -> None:
+        """Calculate the separating hyperplane between two targets.
+
+        Separability is decided with a linear programming feasibility
+        problem over all features at once. We look for weight `w` and
+        bias `c` such that every point `x` of target `a` satisfies
+        w.x + c >= 1 and every point of target `b` satisfies
+        w.x + c <= -1. Both targets are linearly separable if and only
+        if the problem is feasible, and any feasible (w, c) is the
+        certificate of it.
+
+        Args:
+            a (int): First target index (positive side).
+            b (int): Second target index (negative side).
+
+        Raises:
+            ImportError: If scipy is not installed.
+            RuntimeError: If the solver failed to decide the problem.
+        """
+        # Lazy load scipy, it is only needed for this check.
+        from scipy.optimize import linprog
+        # Build the augmented feature matrix of each target once.
+        if self.__nd_points is None:
+            features = self.frame.drop(columns=self.target_key).values
+            features = np.hstack([
+                features.astype(float),
+                np.ones((len(features), 1)),
+            ])
+            target = self.frame[self.target_key].values
+            self.__nd_points = [
+                features[target == i]
+                for i in range(len(self.target_names))
+            ]
+        pa, pb = self.__nd_points[a], self.__nd_points[b]
+        # Write both constraints in `A_ub @ (w, c) <= b_ub` form:
+        #  -(w.x + c) <= -1 for target a
+        #   (w.x + c) <= -1 for target b
+        a_ub = np.vstack([-pa, pb])
+        b_ub = -np.ones(len(a_ub))
+        res = linprog(
+            np.zeros(a_ub.shape[1]),
+            A_ub=a_ub,
+            b_ub=b_ub,
+            bounds=(None, None),
+            method='highs',
+        )
+        # Status 0 means a feasible point is found (separable),
+        # status 2 means the problem is infeasible (not separable).
+        if res.status == 0:
+            self.__hyperplane[(a, b)] = (res.x[:-1], float(res.x[-1]))
+        elif res.status == 2:
+            self.__hyperplane[(a, b)] = None
+        else:
+            raise RuntimeError(
+                "Failed to decide the separability of target "
+                "{} and {}: {}".format(a, b, res.message)
+            )
+
+    def separable_nd(self,
+        class_a: Target,
+        class_b: Target,
+    ) -> Optional[Hyperplane]:
+        """Check linear separability of two targets in full feature space.
+        Target can be given by their index or their name.
+
+        Unlike `getConvex` that only works on a pair of features,
+        this will use every feature in the `frame` at once, so it can
+        find targets that are only separable in the higher dimension.
+        It requires scipy to be installed.
+
+        Args:
+            class_a (int | str): First target.
+            class_b (int | str): Second target.
+
+        Returns:
+            Optional[Hyperplane]: Separating hyperplane (w, c), where
+                w.x + c > 0 for every point of `class_a` and
+                w.x + c < 0 for every point of `class_b`. None if both
+                targets are not linearly separable.
+
+        Raises:
+            ValueError: If the target name is not in `target_names`,
+                or both targets are the same.
+            IndexError: If the target index is out of range.
+        """
+        # Get the pair of target index.
+        a, b = self.__getTarget(class_a), self.__getTarget(class_b)
+        if a == b:
+            raise ValueError(
+                "Both targets should be different (Got {} and {}).".format(
+                    class_a, class_b,
+                )
+            )
+        # The hyperplane of the swapped pair is just the negated one.
+        if (b, a) in self.__hyperplane:
+            res = self.__hyperplane[(b, a)]
+            return None if res is None else (-res[0], -res[1])
+        # If the hyperplane is not calculated, calculate it.
+        if (a, b) not in self.__hyperplane:
+            self.__calculate_nd(a, b)
+        return self.__hyperplane[(a, b)]
+
+    def separable_nd_all(self) -> Dict[Tuple[int, int], Optional[Hyperplane]]:
+        """Check linear separability for every pair of targets
+        in full feature space. One solve is done for each pair.
+
+        Returns:
+            Dict[Tuple[int, int], Optional[Hyperplane]]: Result of
+                `separable_nd` for each pair of target index (a, b),
+                where a < b.
+        """
+        n = len(self.target_names)
+        return {
+            (a, b): self.separable_nd(a, b)
+            for a in range(n)
+            for b in range(a + 1, n)
+        }
+
     def visualize(self,
         pair1: Feature,
         pair2: Feature,
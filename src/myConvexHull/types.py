@@ -1,10 +1,12 @@
 """
 Custom type definitions.
 """
-from typing import Tuple, Union
+from typing import Sequence, Tuple, Union
 
 Vector = Point = Tuple[float, float]
 PointIndex = int
 Line = Tuple[Point, Point]
 LineIndex = Tuple[PointIndex, PointIndex]
 Feature = Union[int, str]
+Target = Union[int, str]
+Hyperplane = Tuple[Sequence[float], float]
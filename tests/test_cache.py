@@ -0,0 +1,127 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from myConvexHull import cache
+from myConvexHull.cache import cache_dir, read_csv_cached
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'data.csv')
+        shutil.copy(
+            os.path.join(
+                os.path.dirname(__file__), '..', 'datasets', 'water_potability.csv'
+            ),
+            self.path,
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def column(self, i: int) -> str:
+        """Get the file path of a column in the current cache.
+        """
+        cdir = cache_dir(self.path)
+        with open(os.path.join(cdir, 'meta.json')) as f:
+            generation = json.load(f)['generation']
+        return os.path.join(cdir, f'{generation}-{i}.npy')
+
+    def test_read_csv_cached(self):
+        """Test that the cached frame is the same as the parsed one,
+        and the cache is invalidated when the file changes.
+        """
+        expected = pd.read_csv(self.path).dropna().reset_index(drop=True)
+        # First read creates the cache, second read loads it.
+        pd.testing.assert_frame_equal(read_csv_cached(self.path), expected)
+        self.assertTrue(os.path.exists(os.path.join(cache_dir(self.path), 'meta.json')))
+        pd.testing.assert_frame_equal(read_csv_cached(self.path), expected)
+        # Touching the file without changing its content keeps the
+        # cache, the csv is not parsed again.
+        os.utime(self.path, (0, 0))
+        with mock.patch.object(pd, 'read_csv', wraps=pd.read_csv) as read_csv:
+            pd.testing.assert_frame_equal(read_csv_cached(self.path), expected)
+            read_csv.assert_not_called()
+        # Changing the content (and size) rebuilds the cache, the file
+        # is only hashed once to store the new key.
+        with open(self.path, 'w') as f:
+            f.write('X,Y,target\n1,2,0\n3,,1\n5,6,1\n')
+        expected = pd.read_csv(self.path).dropna().reset_index(drop=True)
+        with mock.patch.object(cache, 'file_hash', wraps=cache.file_hash) as file_hash:
+            pd.testing.assert_frame_equal(read_csv_cached(self.path), expected)
+            file_hash.assert_called_once()
+        pd.testing.assert_frame_equal(read_csv_cached(self.path), expected)
+        pd.testing.assert_frame_equal(read_csv_cached(self.path, cache=False), expected)
+
+    def test_text_column(self):
+        """Test that non numeric column is cached without pickle.
+        """
+        with open(self.path, 'w') as f:
+            f.write('X,Y,name,target\n1,2,a,0\n3,4,bb,1\n5,,c,1\n')
+        expected = pd.read_csv(self.path).dropna().reset_index(drop=True)
+        pd.testing.assert_frame_equal(read_csv_cached(self.path), expected)
+        pd.testing.assert_frame_equal(read_csv_cached(self.path), expected)
+        # Every column should be loadable without pickle.
+        for i in range(len(expected.columns)):
+            np.load(self.column(i))
+
+    def test_writable(self):
+        """Test that the cached frame is writable, and writing it
+        does not change the cache.
+        """
+        expected = pd.read_csv(self.path).dropna().reset_index(drop=True)
+        for _ in range(2):
+            frame = read_csv_cached(self.path)
+            frame.iloc[0, 0] = -1.0
+            self.assertEqual(frame.iloc[0, 0], -1.0)
+        pd.testing.assert_frame_equal(read_csv_cached(self.path), expected)
+
+    def test_broken_cache(self):
+        """Test that a broken or planted cache is rebuilt.
+        """
+        expected = pd.read_csv(self.path).dropna().reset_index(drop=True)
+        read_csv_cached(self.path)
+        # Missing column file.
+        os.remove(self.column(0))
+        pd.testing.assert_frame_equal(read_csv_cached(self.path), expected)
+        # Truncated column file.
+        with open(self.column(1), 'r+b') as f:
+            f.truncate(100)
+        pd.testing.assert_frame_equal(read_csv_cached(self.path), expected)
+        # Planted pickled column file is never unpickled.
+        np.save(
+            self.column(2),
+            np.array([object()] * len(expected)),
+            allow_pickle=True,
+        )
+        pd.testing.assert_frame_equal(read_csv_cached(self.path), expected)
+        pd.testing.assert_frame_equal(read_csv_cached(self.path), expected)
+
+    def test_rebuild_keeps_old_frame(self):
+        """Test that a frame loaded from the cache is not changed
+        when the cache is rebuilt, even if the new file is shorter.
+        """
+        with open(self.path, 'w') as f:
+            f.write('X,target\n' + '\n'.join(f'{i}.5,0' for i in range(1000)) + '\n')
+        read_csv_cached(self.path)
+        old = read_csv_cached(self.path)
+        expected = old.copy()
+        # Same size, different content.
+        with open(self.path, 'w') as f:
+            f.write('X,target\n' + '\n'.join(f'{i}.7,0' for i in range(1000)) + '\n')
+        self.assertEqual(read_csv_cached(self.path).iloc[1, 0], 1.7)
+        # Shorter file.
+        with open(self.path, 'w') as f:
+            f.write('X,target\n1.5,0\n')
+        self.assertEqual(len(read_csv_cached(self.path)), 1)
+        pd.testing.assert_frame_equal(old, expected)
+        self.assertEqual(old['X'].sum(), expected['X'].sum())
+
+if __name__ == '__main__':
+    unittest.main()
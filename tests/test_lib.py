@@ -1,8 +1,13 @@
+import threading
 import unittest
 
+import numpy as np
+import pandas as pd
+
 from scipy.spatial import ConvexHull
 from sklearn import datasets
 
+from myConvexHull.lib import ConvexHull as MyConvexHull
 from myConvexHull.lib import LinearSeparabilityDataset
 
 class TestConvexHullLibrary(unittest.TestCase):
@@ -76,5 +81,183 @@ class TestConvexHullLibrary(unittest.TestCase):
                         cond2(c['a'][j].points, c['b'][j].points)
                     )
 
+    def test_presorted_order(self):
+        """Test that the convex hull from shared presorted order is
+        exactly the same as the one sorted by the convex hull itself.
+        """
+        class UnsortedConvexHull(MyConvexHull):
+            accept_order = False
+
+        for dname in ['iris', 'wine']:
+            data = getattr(datasets, f'load_{dname}')(as_frame=True)
+            vis = {
+                'a': LinearSeparabilityDataset(
+                    frame=data.frame,
+                    target_names=data.target_names,
+                ),
+                'b': LinearSeparabilityDataset(
+                    frame=data.frame,
+                    target_names=data.target_names,
+                    backend=UnsortedConvexHull,
+                ),
+            }
+            ft_len = len(vis['a'].feature_names)
+            for i in range(ft_len):
+                for j in range(ft_len):
+                    if i == j:
+                        continue
+                    c = {
+                        'a': vis['a'].getConvex(i, j),
+                        'b': vis['b'].getConvex(i, j),
+                    }
+                    for k in range(len(c['a'])):
+                        self.assertEqual(c['a'][k].simplices, c['b'][k].simplices)
+                        self.assertEqual(c['a'][k].vertices, c['b'][k].vertices)
+
+    def test_workers(self):
+        """Test that the convex hull computed with thread pool runs
+        concurrently, keeps the target order, and the error is
+        propagated.
+        """
+        data = datasets.load_wine(as_frame=True)
+        # Every target waits for the others on a barrier, so it can
+        # only pass if all of them are computed at the same time.
+        def barrier_backend(timeout):
+            barrier = threading.Barrier(len(data.target_names), timeout=timeout)
+
+            class BarrierConvexHull(MyConvexHull):
+                def __init__(self, dt, order=None):
+                    barrier.wait()
+                    super().__init__(dt, order)
+
+            return BarrierConvexHull
+
+        vis = LinearSeparabilityDataset(
+            frame=data.frame,
+            target_names=data.target_names,
+            backend=barrier_backend(10),
+            workers=len(data.target_names),
+        )
+        self.assertEqual(len(vis.getConvex(0, 1)), len(data.target_names))
+        vis = LinearSeparabilityDataset(
+            frame=data.frame,
+            target_names=data.target_names,
+            backend=barrier_backend(0.1),
+            workers=1,
+        )
+        with self.assertRaises(threading.BrokenBarrierError):
+            vis.getConvex(0, 1)
+
+        vis = {
+            w: LinearSeparabilityDataset(
+                frame=data.frame,
+                target_names=data.target_names,
+                backend=ConvexHull,
+                workers=w,
+            )
+            for w in [1, 4]
+        }
+        # The thread pool is created once and reused for every pair.
+        names = set()
+
+        class NamingConvexHull(MyConvexHull):
+            def __init__(self, dt, order=None):
+                names.add(threading.current_thread().name)
+                super().__init__(dt, order)
+
+        pooled = LinearSeparabilityDataset(
+            frame=data.frame,
+            target_names=data.target_names,
+            backend=NamingConvexHull,
+            workers=2,
+        )
+        for i in range(len(pooled.feature_names) - 1):
+            pooled.getConvex(i, i+1)
+        self.assertLessEqual(len(names), 2)
+        for i in range(len(vis[1].feature_names) - 1):
+            c = {w: vis[w].getConvex(i, i+1) for w in vis}
+            for j in range(len(c[1])):
+                self.assertTrue(np.array_equal(c[1][j].points, c[4][j].points))
+                self.assertTrue(np.array_equal(c[1][j].simplices, c[4][j].simplices))
+
+        class FailingConvexHull(MyConvexHull):
+            def __init__(self, dt, order=None):
+                raise RuntimeError('failed')
+
+        vis = LinearSeparabilityDataset(
+            frame=data.frame,
+            target_names=data.target_names,
+            backend=FailingConvexHull,
+            workers=4,
+        )
+        with self.assertRaises(RuntimeError):
+            vis.getConvex(0, 1)
+        with self.assertRaises(ValueError):
+            LinearSeparabilityDataset(
+                frame=data.frame,
+                target_names=data.target_names,
+                workers=0,
+            )
+
+    def test_separable_nd(self):
+        """Test the full feature space separability check, both on
+        separable and non separable targets.
+        """
+        # Known answer of each pair, only versicolor and virginica
+        # of iris are not linearly separable.
+        expected = {
+            'iris': {(0, 1): True, (0, 2): True, (1, 2): False},
+            'wine': {(0, 1): True, (0, 2): True, (1, 2): True},
+            'breast_cancer': {(0, 1): True},
+        }
+        for dname in expected:
+            data = getattr(datasets, f'load_{dname}')(as_frame=True)
+            vis = LinearSeparabilityDataset(
+                frame=data.frame,
+                target_names=data.target_names,
+            )
+            features = data.frame.drop(columns='target').values
+            target = data.frame['target'].values
+            result = vis.separable_nd_all()
+            self.assertEqual(
+                {pair: res is not None for pair, res in result.items()},
+                expected[dname],
+            )
+            for (a, b), res in result.items():
+                if res is None:
+                    continue
+                # The hyperplane should really separate both targets.
+                w, c = res
+                self.assertTrue(np.all(features[target == a] @ w + c > 0))
+                self.assertTrue(np.all(features[target == b] @ w + c < 0))
+        # Setosa is separable from the others, swapped pair is negated.
+        data = datasets.load_iris(as_frame=True)
+        vis = LinearSeparabilityDataset(
+            frame=data.frame,
+            target_names=data.target_names,
+        )
+        w, c = vis.separable_nd('setosa', 'versicolor')
+        w2, c2 = vis.separable_nd(1, 0)
+        self.assertTrue(np.allclose(w, -w2) and c == -c2)
+        # XOR pattern is never linearly separable.
+        vis = LinearSeparabilityDataset(
+            frame=pd.DataFrame({
+                'X': [0, 1, 0, 1],
+                'Y': [0, 1, 1, 0],
+                'target': [0, 0, 1, 1],
+            }),
+            target_names=['A', 'B'],
+        )
+        self.assertIsNone(vis.separable_nd('A', 'B'))
+        # Invalid target should raise instead of a bogus answer.
+        with self.assertRaises(IndexError):
+            vis.separable_nd(5, 0)
+        with self.assertRaises(IndexError):
+            vis.separable_nd(0, -1)
+        with self.assertRaises(ValueError):
+            vis.separable_nd(0, 0)
+        with self.assertRaises(ValueError):
+            vis.separable_nd('A', 'C')
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file